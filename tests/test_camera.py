@@ -135,6 +135,135 @@ class CameraTests(g.unittest.TestCase):
             assert all(rid.min(axis=0) == 0)
             assert all(rid.max(axis=0) == current - 1)
 
+    def test_K_cache(self):
+        camera = g.trimesh.scene.Camera(
+            resolution=(320, 240), fov=(60, 40))
+
+        K = camera.K
+        # cached matrix should not be modifiable
+        assert not K.flags.writeable
+        with self.assertRaises(ValueError):
+            K[0, 0] = 1.0
+        assert camera.K is K
+
+        camera.focal = (100, 200)
+        assert np.allclose(camera.K[[0, 1], [0, 1]], [100, 200])
+        assert not camera.K.flags.writeable
+
+        camera.fov = (90, 90)
+        assert np.allclose(camera.K[[0, 1], [0, 1]], [160, 120])
+
+        camera.resolution = (640, 480)
+        assert np.allclose(camera.K[:2, 2], [320, 240])
+        assert np.allclose(camera.K[[0, 1], [0, 1]], [320, 240])
+
+        K_set = np.array([[50, 0, 10],
+                          [0, 60, 20],
+                          [0, 0, 1]], dtype=np.float64)
+        camera.K = K_set
+        assert np.allclose(camera.K, K_set)
+        assert not camera.K.flags.writeable
+
+    def test_ray_cache(self):
+        camera = g.trimesh.scene.Camera(
+            resolution=(32, 24), fov=(60, 40))
+        cameras = g.trimesh.scene.cameras
+
+        def current():
+            xy, pixels = cameras.ray_pixel_coords(camera)
+            vectors = camera.to_rays()[0]
+            # cached values should not be modifiable
+            assert not xy.flags.writeable
+            assert not pixels.flags.writeable
+            assert not vectors.flags.writeable
+            # repeated calls should return the cached arrays
+            assert cameras.ray_pixel_coords(camera)[0] is xy
+            assert camera.to_rays()[0] is vectors
+            return xy.copy(), vectors.copy()
+
+        def changed(a, b):
+            # both the coordinates and the vectors should differ
+            if a[0].shape != b[0].shape:
+                return True
+            return (not np.allclose(a[0], b[0]) and
+                    not np.allclose(a[1], b[1]))
+
+        before = current()
+        camera.fov = (30, 20)
+        after = current()
+        assert changed(before, after)
+
+        before = after
+        camera.resolution = (64, 48)
+        after = current()
+        assert changed(before, after)
+
+        before = after
+        camera.focal = (10, 10)
+        after = current()
+        assert changed(before, after)
+
+        before = after
+        camera.K = [[20, 0, 16], [0, 20, 12], [0, 0, 1]]
+        after = current()
+        assert changed(before, after)
+
+    def test_ray_dtype(self):
+        camera = g.trimesh.scene.Camera(
+            resolution=(32, 24), fov=(60, 40))
+
+        # directions default to single precision
+        vectors = camera.to_rays()[0]
+        assert vectors.dtype == np.float32
+        assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+
+        # double precision should match when requested
+        double = camera.to_rays(dtype=np.float64)[0]
+        assert double.dtype == np.float64
+        assert np.allclose(double, vectors, atol=1e-6)
+
+        # both types are cached at the same time
+        assert camera.to_rays()[0] is vectors
+        assert camera.to_rays(dtype=np.float64)[0] is double
+
+        # scene rays stay in single precision after rotation
+        scene = g.trimesh.Scene(g.trimesh.creation.box())
+        scene.camera.resolution = (32, 24)
+        origins, vectors, pixels = scene.camera_rays()
+        assert vectors.dtype == np.float32
+        assert origins.shape == vectors.shape
+        assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+
+        # double precision can be requested from the scene
+        origins, double, pixels = scene.camera_rays(dtype=np.float64)
+        assert origins.dtype == np.float64
+        assert double.dtype == np.float64
+        assert np.allclose(double, vectors, atol=1e-6)
+
+    def test_rays_read_only(self):
+        scene = g.trimesh.Scene(g.trimesh.creation.box())
+        scene.camera.resolution = (32, 24)
+
+        # camera rays are shared with the cache
+        vectors, pixels = scene.camera.to_rays()
+        for array in (vectors, pixels):
+            assert not array.flags.writeable
+            with self.assertRaises(ValueError):
+                array[0] = 0
+
+        # scene pixels are the cached array from the camera
+        origins, vectors, pixels = scene.camera_rays()
+        assert pixels is scene.camera.to_rays()[1]
+        with self.assertRaises(ValueError):
+            pixels[0] = 0
+        # rotated vectors and origins are new arrays
+        assert vectors.flags.writeable
+        assert origins.flags.writeable
+
+        # a copy can be modified
+        pixels = pixels.copy()
+        pixels[0] = 0
+
 
 if __name__ == '__main__':
     g.trimesh.util.attach_to_log()
@@ -39,6 +39,239 @@ class SampleTest(g.unittest.TestCase):
         assert set(g.np.unique(m.sample(
             100000, return_index=True)[1])) == set(range(len(m.faces)))
 
+    def test_kernels(self):
+        sample = g.trimesh.sample
+        # run the numba kernel if available and the numpy path
+        kernels = [None]
+        if sample._load_pick_points() is not None:
+            kernels.append(sample._pick_points)
+
+        m = g.trimesh.creation.box(extents=[1, 2, 3])
+        # fraction of total area for each face
+        expected = m.area_faces / m.area
+        original = sample._pick_points
+        try:
+            for kernel in kernels:
+                sample._pick_points = kernel
+                points, index = sample.sample_surface(m, 100000)
+                assert points.shape == (100000, 3)
+
+                # every point should be inside its triangle
+                bary = g.trimesh.triangles.points_to_barycentric(
+                    m.triangles[index], points)
+                assert (bary > -1e-8).all()
+                assert (bary < 1 + 1e-8).all()
+
+                # faces should be picked in proportion to area
+                frequency = g.np.bincount(
+                    index, minlength=len(m.faces)) / len(index)
+                assert g.np.allclose(frequency, expected, atol=0.01)
+        finally:
+            sample._pick_points = original
+
+    def test_array_module(self):
+        # a namespace backed by numpy which isn't numpy itself
+        # exercises the path used by modules like cupy
+        class Module(object):
+            pass
+        xp = Module()
+        xp.__dict__.update(vars(g.np))
+        m = g.trimesh.creation.box(extents=[1, 2, 3])
+
+        points, index = g.trimesh.sample.sample_surface_core(
+            m.triangles, m.area_faces, 10000, xp=xp)
+        assert points.shape == (10000, 3)
+        bary = g.trimesh.triangles.points_to_barycentric(
+            m.triangles[index], points)
+        assert (bary > -1e-8).all()
+        assert (bary < 1 + 1e-8).all()
+
+        # weights should be respected
+        weights = g.np.zeros(len(m.faces))
+        weights[3] = 1.0
+        index = g.trimesh.sample.sample_surface_core(
+            m.triangles, m.area_faces, 100,
+            face_weight=weights, xp=xp)[1]
+        assert (index == 3).all()
+
+    def test_even_tiles(self):
+        sample = g.trimesh.sample
+        m = g.trimesh.creation.icosphere()
+        radius = 0.1
+
+        # count how many tiles are drawn
+        original = sample._sample_even_tile
+        calls = []
+
+        def counted(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        try:
+            sample._sample_even_tile = counted
+            # a radius this size needs more than one tile
+            points, index = sample.sample_surface_even(
+                m, 500, radius=radius)
+            assert len(calls) > 1
+            assert len(points) == len(index)
+            # no two samples closer than radius across tiles
+            tree = g.spatial.cKDTree(points)
+            assert len(tree.query_pairs(radius)) == 0
+
+            # a tiny radius should stop after the first tile
+            calls = []
+            points, index = sample.sample_surface_even(
+                m, 100, radius=1e-8)
+            assert len(calls) == 1
+            assert points.shape == (100, 3)
+        finally:
+            sample._sample_even_tile = original
+
+        # nothing requested should return empty arrays
+        points, index = sample.sample_surface_even(m, 0)
+        assert points.shape == (0, 3)
+        assert index.shape == (0,)
+
+    def test_even_short(self):
+        m = g.trimesh.creation.box()
+        # a radius this large can't fit the requested count
+        # so record the warning it should log
+        log = g.trimesh.util.log
+        warnings = []
+        current = log.warning
+        try:
+            log.warning = lambda *args, **kwargs: warnings.append(args)
+            points, index = g.trimesh.sample.sample_surface_even(
+                m, 100, radius=0.5)
+        finally:
+            log.warning = current
+        assert len(warnings) == 1
+        assert len(points) < 100
+        assert len(points) == len(index)
+        assert len(g.spatial.cKDTree(points).query_pairs(0.5)) == 0
+
+    def test_even_quad(self):
+        # two unit quads next to each other
+        vertices = g.np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0],
+                               [0, 1, 0], [2, 0, 0], [2, 1, 0]],
+                              dtype=g.np.float64)
+        faces = g.np.array([[0, 1, 2, 3], [1, 4, 5, 2]])
+        m = g.trimesh.Trimesh(vertices, faces, process=False)
+
+        points, index = g.trimesh.sample.sample_surface_even(m, 100)
+        assert points.shape == (100, 3)
+        assert set(index).issubset({0, 1})
+        assert g.np.allclose(points[:, 2], 0.0)
+        # each point should be inside the quad it came from
+        assert (points[index == 0][:, 0] <= 1.0 + 1e-8).all()
+        assert (points[index == 1][:, 0] >= 1.0 - 1e-8).all()
+
+    def test_volume(self):
+        m = g.trimesh.creation.icosphere()
+        samples = g.trimesh.sample.volume_mesh(m, 1000)
+        # should have gotten every point requested
+        assert samples.shape == (1000, 3)
+        assert m.contains(samples).all()
+
+    def test_alias(self):
+        # alias table should reproduce the weights exactly
+        weights = g.np.random.random(100) ** 3
+        weights[::7] = 0.0
+        prob, alias = g.trimesh.sample._build_alias(weights)
+
+        assert (prob >= 0.0).all()
+        assert (prob <= 1.0).all()
+
+        # probability of picking each index from the table
+        check = prob.copy()
+        g.np.add.at(check, alias, 1.0 - prob)
+        check /= len(weights)
+        assert g.np.allclose(check, weights / weights.sum())
+
+    def test_legacy_random(self):
+        # numpy < 1.17 has no `Generator` so make sure
+        # the `RandomState` fallback produces valid samples
+        sample = g.trimesh.sample
+        m = g.trimesh.creation.icosphere()
+        current = sample._has_generator, sample._local
+        try:
+            sample._has_generator = False
+            sample._local = g.threading.local()
+            assert isinstance(sample._generator(),
+                              g.np.random.RandomState)
+
+            samples = sample.sample_surface(m, 1000)[0]
+            assert samples.shape == (1000, 3)
+            assert g.np.abs(m.nearest.signed_distance(
+                samples)).max() < 1e-4
+
+            assert sample.volume_mesh(m, 100).shape == (100, 3)
+            assert sample.volume_rectangular(
+                [1, 2, 3], 100).shape == (100, 3)
+            sphere = sample.sample_surface_sphere(100)
+            assert g.np.allclose(g.np.linalg.norm(sphere, axis=1), 1.0)
+        finally:
+            sample._has_generator, sample._local = current
+
+    def test_seed(self):
+        # the same seed should produce the same samples
+        sample = g.trimesh.sample
+        m = g.trimesh.creation.icosphere()
+        quad = g.trimesh.Trimesh(
+            vertices=[[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]],
+            faces=[[0, 1, 2, 3]], process=False)
+
+        checks = [
+            lambda seed: m.sample(1000, return_index=True, seed=seed),
+            lambda seed: sample.sample_surface(
+                m, 100000, seed=seed),
+            lambda seed: sample.sample_surface_even(
+                m, 100, seed=seed),
+            lambda seed: sample.sample_surface_even(
+                quad, 100, seed=seed),
+            lambda seed: sample.volume_mesh(m, 100, seed=seed),
+            lambda seed: sample.volume_rectangular(
+                [1, 2, 3], 100, seed=seed),
+            lambda seed: sample.sample_surface_sphere(100, seed=seed)]
+        for check in checks:
+            a = check(10)
+            b = check(10)
+            c = check(11)
+            if not isinstance(a, tuple):
+                a, b, c = (a,), (b,), (c,)
+            assert all(g.np.array_equal(i, j) for i, j in zip(a, b))
+            assert not g.np.array_equal(a[0], c[0])
+
+        # passing a generator should draw from it
+        if hasattr(g.np.random, 'default_rng'):
+            rng = g.np.random.default_rng(10)
+        else:
+            rng = g.np.random.RandomState(10)
+        assert g.np.array_equal(
+            sample.sample_surface_sphere(100, seed=rng),
+            sample.sample_surface_sphere(100, seed=10))
+
+    def test_scratch(self):
+        # scratch buffers should only be as large as requested
+        sample = g.trimesh.sample
+        current = sample._local
+        try:
+            sample._local = g.threading.local()
+            small = sample._scratch((10, 3))
+            assert small.shape == (10, 3)
+            assert sample._local.buffers[(3,)].shape == (10, 3)
+            # larger request should grow the buffer
+            assert sample._scratch((100, 3)).shape == (100, 3)
+            assert sample._local.buffers[(3,)].shape == (100, 3)
+            # and a smaller one should reuse it
+            assert sample._scratch((5, 3)).base is \
+                sample._local.buffers[(3,)]
+            # requests larger than a tile aren't kept
+            sample._scratch((sample._TILE + 1, 3))
+            assert sample._local.buffers[(3,)].shape == (100, 3)
+        finally:
+            sample._local = current
+
 
 if __name__ == '__main__':
     g.trimesh.util.attach_to_log()
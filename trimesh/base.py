@@ -2260,7 +2260,7 @@ class Trimesh(Geometry3D):
         hull = convex.convex_hull(self)
         return hull
 
-    def sample(self, count, return_index=False, face_weight=None):
+    def sample(self, count, return_index=False, face_weight=None, seed=None):
         """
         Return random samples distributed across the
         surface of the mesh
@@ -2275,6 +2275,10 @@ class Trimesh(Geometry3D):
         face_weight : None or len(mesh.faces) float
           Weight faces by a factor other than face area.
           If None will be the same as face_weight=mesh.area
+        seed : None, int or numpy.random.Generator
+          Seed for the random values or a generator to
+          draw them from, if None a generator for the
+          current thread is used
 
         Returns
         ---------
@@ -2284,7 +2288,7 @@ class Trimesh(Geometry3D):
           Index of self.faces
         """
         samples, index = sample.sample_surface(
-            mesh=self, count=count, face_weight=face_weight)
+            mesh=self, count=count, face_weight=face_weight, seed=seed)
         if return_index:
             return samples, index
         return samples
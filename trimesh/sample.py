@@ -5,18 +5,318 @@ sample.py
 Randomly sample surface and volume of meshes.
 """
 
+import threading
+
 import numpy as np
 
 from . import util
 from . import transformations
 from . import triangles
 
+# number of samples to generate at once in the numpy
+# path so the working set of each tile fits in cache
+_TILE = 1 << 16
+
+# per-thread random generators and scratch buffers
+# so sampling doesn't go through the locked global-state
+# `np.random` functions and threads don't share buffers
+_local = threading.local()
+
 
-def sample_surface(mesh, count, face_weight=None):
-    return sample_surface_core(mesh.triangles, mesh.area_faces, count, face_weight)
+# `numpy.random.Generator` was added in numpy 1.17
+_has_generator = hasattr(np.random, 'default_rng')
 
 
-def sample_surface_core(mesh_triangles, area_faces, count, face_weight=None):
+def _generator(seed=None):
+    """
+    Get the random generator for the current thread,
+    or a generator for the passed seed.
+
+    Parameters
+    ------------
+    seed : None, int, numpy.random.Generator or RandomState
+      If None use the generator for the current thread,
+      if an int create a new generator seeded with it,
+      otherwise the passed generator is returned as-is
+
+    Returns
+    ----------
+    rng : numpy.random.Generator or numpy.random.RandomState
+      Generator to draw from, which is a RandomState
+      on versions of numpy older than 1.17
+    """
+    if seed is not None:
+        if hasattr(seed, 'random_sample') or hasattr(seed, 'integers'):
+            return seed
+        if _has_generator:
+            return np.random.default_rng(seed)
+        return np.random.RandomState(seed)
+    rng = getattr(_local, 'rng', None)
+    if rng is None:
+        if _has_generator:
+            rng = np.random.default_rng()
+        else:
+            rng = np.random.RandomState()
+        _local.rng = rng
+    return rng
+
+
+def _random(size=None, out=None, rng=None):
+    """
+    Get uniform random floats in [0.0, 1.0) from a generator.
+
+    Parameters
+    ------------
+    size : None or tuple of int
+      Shape of values to return if `out` isn't passed
+    out : None or float
+      C-contiguous array to fill with random values
+    rng : None or numpy.random.Generator or RandomState
+      Generator to draw from, or the generator
+      for the current thread if None
+
+    Returns
+    ------------
+    values : float
+      Random values, which is `out` if it was passed
+    """
+    if rng is None:
+        rng = _generator()
+    if hasattr(rng, 'integers'):
+        return rng.random(size, out=out)
+    # older numpy can't fill an existing array
+    if out is None:
+        return rng.random_sample(size)
+    out[...] = rng.random_sample(out.shape)
+    return out
+
+
+def _integers(high, size, rng=None):
+    """
+    Get random integers in [0, high) from a generator.
+
+    Parameters
+    ------------
+    high : int
+      Exclusive upper bound of values
+    size : int
+      Number of values to return
+    rng : None or numpy.random.Generator or RandomState
+      Generator to draw from, or the generator
+      for the current thread if None
+
+    Returns
+    ------------
+    values : (size,) int
+      Random integers
+    """
+    if rng is None:
+        rng = _generator()
+    if hasattr(rng, 'integers'):
+        return rng.integers(0, high, size)
+    return rng.randint(0, high, size)
+
+
+def _scratch(shape):
+    """
+    Get a float buffer for intermediate values which is reused
+    by the current thread. The contents are only valid until the
+    next request with the same trailing shape, so it should never
+    be returned to the caller. Buffers only grow to the largest
+    request seen up to one tile, and requests longer than a tile
+    are allocated every time so large buffers aren't held onto.
+
+    Parameters
+    ------------
+    shape : tuple of int
+      Shape of the requested buffer
+
+    Returns
+    ------------
+    buffer : float
+      Uninitialized array of the requested shape
+    """
+    if shape[0] > _TILE:
+        return np.empty(shape, dtype=np.float64)
+    buffers = getattr(_local, 'buffers', None)
+    if buffers is None:
+        buffers = {}
+        _local.buffers = buffers
+    tail = tuple(shape[1:])
+    buffer = buffers.get(tail)
+    if buffer is None or len(buffer) < shape[0]:
+        buffer = np.empty(shape, dtype=np.float64)
+        buffers[tail] = buffer
+    return buffer[:shape[0]]
+
+
+# compiled triangle point picking kernel which is
+# loaded on first use by `_load_pick_points`
+_pick_points = None
+_pick_points_loaded = False
+
+
+def _load_pick_points():
+    """
+    Compile the triangle point picking kernel with numba the
+    first time it is requested, so importing trimesh doesn't
+    pay for importing numba.
+
+    Returns
+    ----------
+    pick_points : function or None
+      Compiled kernel or None if numba isn't available
+    """
+    global _pick_points, _pick_points_loaded
+    if _pick_points_loaded:
+        return _pick_points
+    _pick_points_loaded = True
+
+    try:
+        # numba lets us fuse triangle point picking into one pass
+        import numba
+    except BaseException:
+        return None
+
+    @numba.njit(parallel=True, fastmath=True)
+    def pick_points(tris, face_index, lengths, out):
+        """
+        Generate one point per face index using two random
+        lengths along the edge vectors of each triangle,
+        reflecting lengths that would leave the triangle.
+        """
+        for i in numba.prange(face_index.size):
+            f = face_index[i]
+            a = lengths[i, 0]
+            b = lengths[i, 1]
+            if a + b > 1.0:
+                a = 1.0 - a
+                b = 1.0 - b
+            for j in range(3):
+                origin = tris[f, 0, j]
+                out[i, j] = (origin +
+                             a * (tris[f, 1, j] - origin) +
+                             b * (tris[f, 2, j] - origin))
+
+    _pick_points = pick_points
+    return _pick_points
+
+
+def sample_surface(mesh, count, face_weight=None, seed=None):
+    alias = None
+    if face_weight is None:
+        # the alias table for area weighting only depends on
+        # the mesh so store it in the cache for repeated sampling
+        alias = mesh._cache['area_alias']
+        if alias is None:
+            alias = _build_alias(mesh.area_faces)
+            mesh._cache['area_alias'] = alias
+    return sample_surface_core(mesh.triangles,
+                               mesh.area_faces,
+                               count,
+                               face_weight,
+                               alias=alias,
+                               seed=seed)
+
+
+def _quad_tables(mesh):
+    """
+    Split each quad of a mesh into two triangles and get the
+    values needed to sample each set of triangles by area,
+    storing them in the mesh cache for repeated sampling.
+
+    Parameters
+    ------------
+    mesh : trimesh.Trimesh
+      Mesh with (n, 4) int faces
+
+    Returns
+    ------------
+    tables : list of ((n, 3, 3) float, (n,) float, tuple)
+      Triangles, areas and alias table for each half of the quads
+    """
+    tables = mesh._cache['quad_tables']
+    if tables is not None:
+        return tables
+    tables = []
+    for order in ([0, 1, 2], [0, 2, 3]):
+        tri = mesh.triangles[:, order, :]
+        area = triangles.area(triangles=tri, crosses=None, sum=False)
+        tables.append((tri, area, _build_alias(area)))
+    mesh._cache['quad_tables'] = tables
+    return tables
+
+
+def _build_alias(face_weight, xp=np):
+    """
+    Build the tables for Walker's alias method, which allows
+    picking weighted indexes with two uniform draws per sample.
+
+    Rather than the usual sequential pairing of light and heavy
+    entries this lays out the deficits of the light entries and
+    the surpluses of the heavy entries on the same cumulative axis
+    so the whole table is constructed with vectorized operations.
+
+    Parameters
+    ------------
+    face_weight : (n,) float
+      Non-negative weight for each face
+    xp : module
+      Array module the weights are stored in, i.e. numpy or cupy
+
+    Returns
+    ------------
+    prob : (n,) float
+      Probability of keeping the picked index
+    alias : (n,) int
+      Index to use if the picked index is not kept
+    """
+    face_weight = xp.asarray(face_weight, dtype=xp.float64)
+    count = len(face_weight)
+
+    # scale weights so the mean is 1.0
+    scaled = face_weight * (count / face_weight.sum())
+    prob = xp.ones(count, dtype=xp.float64)
+    alias = xp.arange(count, dtype=xp.int64)
+
+    light = xp.nonzero(scaled < 1.0)[0]
+    heavy = xp.nonzero(scaled >= 1.0)[0]
+    if len(light) == 0 or len(heavy) == 0:
+        return prob, alias
+
+    # the interval each light entry needs filled
+    deficit = 1.0 - scaled[light]
+    deficit_end = xp.cumsum(deficit)
+    deficit_start = deficit_end - deficit
+    # the interval each heavy entry can give away
+    surplus_end = xp.cumsum(scaled[heavy] - 1.0)
+
+    # each light entry is filled by the heavy entry
+    # whose surplus interval contains its deficit start
+    donor = xp.searchsorted(surplus_end, deficit_start, side='right')
+    prob[light] = scaled[light]
+    alias[light] = heavy[xp.clip(donor, 0, len(heavy) - 1)]
+
+    # a heavy entry which gave away more than its surplus is filled
+    # by the next heavy entry, which is where its overshoot lands
+    last = xp.searchsorted(deficit_start, surplus_end, side='left') - 1
+    overshoot = deficit_end[xp.clip(last, 0, None)] - surplus_end
+    overshoot[last < 0] = 0.0
+    overshoot = xp.clip(overshoot, 0.0, 1.0)
+    prob[heavy] = 1.0 - overshoot
+    alias[heavy[:-1]] = heavy[1:]
+
+    return prob, alias
+
+
+def sample_surface_core(mesh_triangles,
+                        area_faces,
+                        count,
+                        face_weight=None,
+                        alias=None,
+                        out=None,
+                        xp=np,
+                        seed=None):
     """
     Sample the surface of a mesh, returning the specified
     number of points
@@ -33,6 +333,17 @@ def sample_surface_core(mesh_triangles, area_faces, count, face_weight=None):
     face_weight : None or len(mesh.faces) float
       Weight faces by a factor other than face area.
       If None will be the same as face_weight=mesh.area
+    alias : None or ((n,) float, (n,) int)
+      Precomputed result of `_build_alias` for the weights
+    out : None or (count, 3) float
+      If passed samples will be written into this array
+    xp : module
+      Array module to sample with, i.e. `cupy` to run on a
+      GPU if all passed arrays are stored with that module
+    seed : None, int or numpy.random.Generator
+      Seed for the random values or a generator to draw
+      them from, if None a generator for the current
+      thread is used and `np.random.seed` has no effect
 
     Returns
     ---------
@@ -41,55 +352,117 @@ def sample_surface_core(mesh_triangles, area_faces, count, face_weight=None):
     face_index : (count,) int
       Indices of faces for each sampled point
     """
-
-    if face_weight is None:
-        # len(mesh.faces) float, array of the areas
-        # of each face of the mesh
-        face_weight = area_faces
-
-    # cumulative sum of weights (len(mesh.faces))
-    weight_cum = np.cumsum(face_weight)
-
-    # last value of cumulative sum is total summed weight/area
-    face_pick = np.random.random(count) * weight_cum[-1]
-    # get the index of the selected faces
-    face_index = np.searchsorted(weight_cum, face_pick)
+    if xp is np:
+        rng = _generator(seed)
+    else:
+        # other array modules mirror the legacy numpy API
+        if seed is None:
+            rng = xp.random
+        elif hasattr(seed, 'random_sample'):
+            rng = seed
+        else:
+            rng = xp.random.RandomState(seed)
+        random = rng.random_sample
+
+    if alias is None:
+        if face_weight is None:
+            # len(mesh.faces) float, array of the areas
+            # of each face of the mesh
+            face_weight = area_faces
+        alias = _build_alias(face_weight, xp=xp)
+    prob, alias = alias
+
+    # pick faces uniformly and then either keep them
+    # or swap them for their alias using the weight table
+    if xp is np:
+        face_index = _integers(len(prob), count, rng=rng)
+        keep = _random(out=_scratch((count,)), rng=rng) < prob[face_index]
+    else:
+        face_index = rng.randint(0, len(prob), count)
+        keep = random(count) < prob[face_index]
+    face_index = xp.where(keep, face_index, alias[face_index])
+
+    if out is None:
+        out = xp.empty((count, 3), dtype=xp.float64)
+
+    pick_points = None
+    if xp is np and count > _TILE:
+        # only worth compiling the kernel for large counts
+        pick_points = _load_pick_points()
+    if pick_points is not None:
+        # run the whole per-sample chain in a single compiled pass
+        pick_points(
+            np.ascontiguousarray(mesh_triangles, dtype=np.float64),
+            face_index,
+            _random((count, 2), rng=rng),
+            out)
+        return out, face_index
+
+    if xp is np:
+        # gathering with `take` requires a matching dtype
+        mesh_triangles = np.asanyarray(mesh_triangles, dtype=np.float64)
+        # generate samples in tiles so the gathered edge vectors
+        # and random lengths for each tile stay in cache
+        tile = _TILE
+    else:
+        # other devices don't benefit from CPU cache tiling
+        tile = max(count, 1)
 
     # pull triangles into the form of an origin + 2 vectors
+    # broadcasting the origin avoids replicating it per-edge
     tri_origins = mesh_triangles[:, 0]
-    tri_vectors = mesh_triangles[:, 1:].copy()
-    tri_vectors -= np.tile(tri_origins, (1, 2)).reshape((-1, 2, 3))
-
-    # pull the vectors for the faces we are going to sample from
-    tri_origins = tri_origins[face_index]
-    tri_vectors = tri_vectors[face_index]
-
-    # randomly generate two 0-1 scalar components to multiply edge vectors by
-    random_lengths = np.random.random((len(tri_vectors), 2, 1))
-
-    # points will be distributed on a quadrilateral if we use 2 0-1 samples
-    # if the two scalar components sum less than 1.0 the point will be
-    # inside the triangle, so we find vectors longer than 1.0 and
-    # transform them to be inside the triangle
-    random_test = random_lengths.sum(axis=1).reshape(-1) > 1.0
-    random_lengths[random_test] -= 1.0
-    random_lengths = np.abs(random_lengths)
-
-    # multiply triangle edge vectors by the random lengths and sum
-    sample_vector = (tri_vectors * random_lengths).sum(axis=1)
-
-    # finally, offset by the origin to generate
-    # (n,3) points in space on the triangle
-    samples = sample_vector + tri_origins
-
-    return samples, face_index
-
-
-def volume_mesh(mesh, count):
+    tri_vectors = mesh_triangles[:, 1:] - mesh_triangles[:, :1]
+
+    for start in range(0, count, tile):
+        end = min(start + tile, count)
+        index = face_index[start:end]
+
+        # randomly generate two 0-1 scalar components to multiply edge
+        # vectors by and pull the vectors for the faces we are sampling
+        if xp is np:
+            random_lengths = _scratch((end - start, 2))
+            _random(out=random_lengths, rng=rng)
+            # `take` into a buffer is much faster than fancy indexing
+            vectors = np.take(
+                tri_vectors, index, axis=0, mode='clip',
+                out=_scratch((end - start,) + tri_vectors.shape[1:]))
+            origins = np.take(
+                tri_origins, index, axis=0, mode='clip',
+                out=_scratch((end - start, 3)))
+        else:
+            random_lengths = random((end - start, 2))
+            vectors = tri_vectors[index]
+            origins = tri_origins[index]
+
+        # points will be distributed on a quadrilateral if we use 2 0-1 samples
+        # if the two scalar components sum less than 1.0 the point will be
+        # inside the triangle, so we find vectors longer than 1.0 and
+        # transform them to be inside the triangle
+        # subtracting the boolean test as a float is branchless
+        flip = (random_lengths[:, 0] + random_lengths[:, 1]) > 1.0
+        random_lengths -= flip.astype(random_lengths.dtype).reshape((-1, 1))
+        xp.abs(random_lengths, out=random_lengths)
+
+        # multiply triangle edge vectors by the random lengths and sum
+        # then offset by the origin to generate (n, 3) points in space
+        samples = out[start:end]
+        if xp is np:
+            np.einsum('nij,ni->nj', vectors, random_lengths, out=samples)
+        else:
+            samples[:] = xp.einsum('nij,ni->nj', vectors, random_lengths)
+        samples += origins
+
+    return out, face_index
+
+
+def volume_mesh(mesh, count, max_iter=10, seed=None):
     """
     Use rejection sampling to produce points randomly
     distributed in the volume of a mesh.
 
+    Points are drawn in batches sized from the acceptance
+    ratio of previous batches until `count` points are found
+    or `max_iter` batches have been tested.
 
     Parameters
     -----------
@@ -97,21 +470,57 @@ def volume_mesh(mesh, count):
       Geometry to sample
     count : int
       Number of points to return
+    max_iter : int
+      Maximum number of batches to draw
+    seed : None, int or numpy.random.Generator
+      Seed for the random values or a generator to draw
+      them from, if None a generator for the current
+      thread is used and `np.random.seed` has no effect
 
     Returns
     ---------
     samples : (n, 3) float
       Points in the volume of the mesh where n <= count
     """
-    points = (np.random.random((count, 3)) * mesh.extents) + mesh.bounds[0]
-    contained = mesh.contains(points)
-    samples = points[contained][:count]
-    return samples
+    extents = mesh.extents
+    origin = mesh.bounds[0]
+    rng = _generator(seed)
+
+    samples = []
+    found = 0
+    drawn = 0
+    batch = count
+    # buffer of random points reused between batches
+    buffer = np.empty((0, 3), dtype=np.float64)
+    for _ in range(max_iter):
+        if len(buffer) < batch:
+            buffer = np.empty((batch, 3), dtype=np.float64)
+        points = buffer[:batch]
+        _random(out=points, rng=rng)
+        points *= extents
+        points += origin
+
+        # boolean indexing copies so the buffer can be reused
+        contained = points[mesh.contains(points)][:count - found]
+        samples.append(contained)
+        found += len(contained)
+        drawn += batch
+        if found >= count:
+            break
+
+        # size the next batch from the acceptance ratio so far
+        # with some padding so one more batch usually suffices
+        ratio = max(float(found) / drawn, 1e-3)
+        batch = min(int((count - found) / ratio * 1.2) + 1,
+                    count * 10)
+
+    return np.concatenate(samples)
 
 
 def volume_rectangular(extents,
                        count,
-                       transform=None):
+                       transform=None,
+                       seed=None):
     """
     Return random samples inside a rectangular volume,
     useful for sampling inside oriented bounding boxes.
@@ -124,13 +533,18 @@ def volume_rectangular(extents,
       Number of points to return
     transform : (4, 4) float
       Homogeneous transformation matrix
+    seed : None, int or numpy.random.Generator
+      Seed for the random values or a generator to draw
+      them from, if None a generator for the current
+      thread is used and `np.random.seed` has no effect
 
     Returns
     ---------
     samples : (count, 3) float
       Points in requested volume
     """
-    samples = np.random.random((count, 3)) - .5
+    samples = _random((count, 3), rng=_generator(seed))
+    samples -= .5
     samples *= extents
     if transform is not None:
         samples = transformations.transform_points(samples,
@@ -138,11 +552,12 @@ def volume_rectangular(extents,
     return samples
 
 
-def sample_surface_even(mesh, count, radius=None):
+def sample_surface_even(mesh, count, radius=None, seed=None):
     """
     Sample the surface of a mesh, returning samples which are
     VERY approximately evenly spaced. This is accomplished by
-    sampling and then rejecting pairs that are too close together.
+    sampling in tiles and then rejecting pairs that are too close
+    together, stopping as soon as enough samples are accepted.
 
     Note that since it is using rejection sampling it may return
     fewer points than requested (i.e. n < count). If this is the
@@ -156,6 +571,10 @@ def sample_surface_even(mesh, count, radius=None):
       Number of points to return
     radius : None or float
       Removes samples below this radius
+    seed : None, int or numpy.random.Generator
+      Seed for the random values or a generator to draw
+      them from, if None a generator for the current
+      thread is used and `np.random.seed` has no effect
 
     Returns
     ---------
@@ -164,43 +583,106 @@ def sample_surface_even(mesh, count, radius=None):
     face_index : (n,) int
       Indices of faces for each sampled point
     """
+    from scipy.spatial import cKDTree
     from .points import remove_close
 
+    if count <= 0:
+        return (np.zeros((0, 3), dtype=np.float64),
+                np.zeros(0, dtype=np.int64))
+
     # guess radius from area
     if radius is None:
         radius = np.sqrt(mesh.area / (mesh.faces.shape[1] * count))
 
-    # get points on the surface
+    # never draw more samples than the previous fixed oversampling
     if mesh.faces.shape[1] == 3:
-        points, index = sample_surface(mesh, count * 3)
-    else:  # quad mesh support
-        triangles_0 = mesh.triangles[:, [0, 1, 2], :]
-        triangles_1 = mesh.triangles[:, [0, 2, 3], :]
-        areas_0 = triangles.area(triangles=triangles_0, crosses=None, sum=False)
-        areas_1 = triangles.area(triangles=triangles_1, crosses=None, sum=False)
-        points_0, index_0 = sample_surface_core(triangles_0, areas_0, count * 2)
-        points_1, index_1 = sample_surface_core(triangles_1, areas_1, count * 2)
-        points = np.concatenate((points_0.reshape(points_0.shape[0], 1, points_0.shape[1]),
-                                 points_1.reshape(points_1.shape[0], 1, points_1.shape[1])
-                                 ), axis=1).reshape(points_0.shape[0] + points_1.shape[0], -1)
-        index = np.concatenate((index_0.reshape(index_0.shape[0], 1),
-                                index_1.reshape(index_1.shape[0], 1)),
-                               axis=1).reshape(index_0.shape[0] + index_1.shape[0])
-    # remove the points closer than radius
-    points, mask = remove_close(points, radius)
+        budget = count * 3
+    else:
+        budget = count * 4
+
+    # draw every tile from the same generator
+    rng = _generator(seed)
+
+    points = []
+    index = []
+    found = 0
+    drawn = 0
+    # draw tiles of samples and stop as soon as we have enough
+    while found < count and drawn < budget:
+        tile = min(count, budget - drawn)
+        candidate, candidate_index = _sample_even_tile(
+            mesh, tile, rng)
+        drawn += tile
+
+        if found > 0:
+            # reject samples within radius of an accepted sample
+            distance = cKDTree(np.vstack(points)).query(
+                candidate, distance_upper_bound=radius)[0]
+            keep = distance > radius
+            candidate = candidate[keep]
+            candidate_index = candidate_index[keep]
+
+        # remove the points in the tile closer than radius
+        candidate, mask = remove_close(candidate, radius)
+        points.append(candidate)
+        index.append(candidate_index[mask])
+        found += len(candidate)
+
+    points = np.vstack(points)
+    index = np.concatenate(index)
 
     # we got all the samples we expect
     if len(points) >= count:
-        return points[:count], index[mask][:count]
+        return points[:count], index[:count]
 
     # warn if we didn't get all the samples we expect
     util.log.warning('only got {}/{} samples!'.format(
         len(points), count))
 
-    return points, index[mask]
+    return points, index
+
+
+def _sample_even_tile(mesh, count, rng):
+    """
+    Sample the surface of a triangle or quad mesh for
+    one tile of `sample_surface_even`.
 
+    Parameters
+    -----------
+    mesh : trimesh.Trimesh
+      Geometry to sample the surface of
+    count : int
+      Number of points to return
+    rng : numpy.random.Generator or RandomState
+      Generator to draw random values from
 
-def sample_surface_sphere(count):
+    Returns
+    ---------
+    samples : (count, 3) float
+      Points in space on the surface of mesh
+    face_index : (count,) int
+      Indices of faces for each sampled point
+    """
+    if mesh.faces.shape[1] == 3:
+        return sample_surface(mesh, count, seed=rng)
+
+    # quad mesh support
+    (triangles_0, areas_0, alias_0), (triangles_1, areas_1, alias_1) = \
+        _quad_tables(mesh)
+    # interleave samples from each half of the quads by
+    # writing them directly into views of one buffer
+    points = np.empty((count, 3), dtype=np.float64)
+    index = np.empty(count, dtype=np.int64)
+    index[0::2] = sample_surface_core(
+        triangles_0, areas_0, len(index[0::2]),
+        alias=alias_0, out=points[0::2], seed=rng)[1]
+    index[1::2] = sample_surface_core(
+        triangles_1, areas_1, len(index[1::2]),
+        alias=alias_1, out=points[1::2], seed=rng)[1]
+    return points, index
+
+
+def sample_surface_sphere(count, seed=None):
     """
     Correctly pick random points on the surface of a unit sphere
 
@@ -211,6 +693,10 @@ def sample_surface_sphere(count):
     -----------
     count : int
       Number of points to return
+    seed : None, int or numpy.random.Generator
+      Seed for the random values or a generator to draw
+      them from, if None a generator for the current
+      thread is used and `np.random.seed` has no effect
 
     Returns
     ----------
@@ -218,11 +704,20 @@ def sample_surface_sphere(count):
       Random points on the surface of a unit sphere
     """
     # get random values 0.0-1.0
-    u, v = np.random.random((2, count))
-    # convert to two angles
-    theta = np.pi * 2 * u
-    phi = np.arccos((2 * v) - 1)
-    # convert spherical coordinates to cartesian
-    points = util.spherical_to_vector(
-        np.column_stack((theta, phi)))
+    uv = _random(out=_scratch((count, 2)), rng=_generator(seed))
+    u, v = uv[:, 0], uv[:, 1]
+    points = np.empty((count, 3), dtype=np.float64)
+    # z is the cosine of the polar angle so there
+    # is no need to compute the angle itself
+    z = points[:, 2]
+    np.multiply(v, 2.0, out=z)
+    z -= 1.0
+    # radius of the circle at each height
+    radius = np.sqrt(1.0 - z * z)
+    # azimuthal angle
+    theta = np.multiply(u, np.pi * 2, out=u)
+    np.cos(theta, out=points[:, 0])
+    points[:, 0] *= radius
+    np.sin(theta, out=points[:, 1])
+    points[:, 1] *= radius
     return points
@@ -4,6 +4,9 @@ import numpy as np
 
 from .. import util
 
+# multiply by this to convert degrees to radians
+_DEG2RAD = np.pi / 180.0
+
 
 class Camera(object):
 
@@ -50,6 +53,9 @@ class Camera(object):
         # store whether or not we computed the focal length
         self._focal_computed = False
 
+        # cached values derived from resolution, focal and fov
+        self._clear_cache()
+
         # set the passed (2,) float focal length
         self.focal = focal
 
@@ -66,6 +72,20 @@ class Camera(object):
         # what is the closest to the camera it should render
         self.z_near = float(z_near)
 
+    def _clear_cache(self):
+        """
+        Unset every cached value which is computed from the
+        resolution, focal length or field of view.
+        """
+        # the result of `ray_pixel_coords`
+        self._pixel_coords = None
+        # the result of `camera_to_rays` keyed by dtype
+        self._rays = {}
+        # the intrinsic matrix
+        self._K = None
+        # the tangent of half the field of view
+        self._tan_half_fov = None
+
     def copy(self):
         """
         Safely get a copy of the current camera.
@@ -103,6 +123,8 @@ class Camera(object):
             raise ValueError('resolution must be (2,) float')
         values.flags.writeable = False
         self._resolution = values
+        # derived values depend on resolution
+        self._clear_cache()
         # unset computed value that depends on the other plus resolution
         if self._focal_computed:
             self._focal = None
@@ -123,7 +145,7 @@ class Camera(object):
         if self._focal is None:
             # calculate focal length from FOV
             focal = (
-                self._resolution / (2.0 * np.tan(np.radians(self._fov / 2.0))))
+                self._resolution / (2.0 * _tan_half_fov(self)))
             focal.flags.writeable = False
             self._focal = focal
 
@@ -154,6 +176,8 @@ class Camera(object):
             self._focal = values
             # focal overrides FOV
             self._fov = None
+        # derived values depend on focal length
+        self._clear_cache()
 
     @property
     def K(self):
@@ -165,11 +189,14 @@ class Camera(object):
         K : (3, 3) float
           Intrinsic matrix for camera
         """
-        K = np.eye(3, dtype=np.float64)
-        K[0, 0] = self.focal[0]
-        K[1, 1] = self.focal[1]
-        K[:2, 2] = self.resolution / 2.0
-        return K
+        if self._K is None:
+            K = np.eye(3, dtype=np.float64)
+            K[0, 0] = self.focal[0]
+            K[1, 1] = self.focal[1]
+            K[:2, 2] = self.resolution / 2.0
+            K.flags.writeable = False
+            self._K = K
+        return self._K
 
     @K.setter
     def K(self, values):
@@ -231,19 +258,30 @@ class Camera(object):
             self._fov = values
             # fov overrides focal
             self._focal = None
+        # derived values depend on fov
+        self._clear_cache()
 
-    def to_rays(self):
+    def to_rays(self, dtype=np.float32):
         """
         Calculate ray direction vectors.
 
         Will return one ray per pixel, as set in self.resolution.
+        The returned arrays are cached on the camera and are
+        read-only, so copy them before modifying in place.
+
+        Parameters
+        --------------
+        dtype : numpy.dtype
+          Floating point type for the direction vectors
 
         Returns
         --------------
         vectors : (n, 3) float
           Ray direction vectors in camera frame with z == -1
+        pixels : (n, 2) int
+          Which pixel each ray corresponds to in an image
         """
-        return camera_to_rays(self)
+        return camera_to_rays(self, dtype=dtype)
 
     def angles(self):
         """
@@ -330,7 +368,9 @@ def look_at(points, fov, rotation=None, distance=None, center=None, pad=None):
 
     if center is None:
         # Find the center of the points' AABB in camera frame
-        center_c = points_c.min(axis=0) + 0.5 * points_c.ptp(axis=0)
+        # use the two reductions directly rather than `ptp`
+        # which would do a third pass for the minimum again
+        center_c = 0.5 * (points_c.min(axis=0) + points_c.max(axis=0))
     else:
         # Transform center to camera frame
         center_c = rinv.dot(center)
@@ -340,7 +380,7 @@ def look_at(points, fov, rotation=None, distance=None, center=None, pad=None):
 
     # Find the minimum distance for the camera from the origin
     # so that all points fit in the view frustrum
-    tfov = np.tan(np.radians(fov) / 2.0)
+    tfov = np.tan(np.asanyarray(fov, dtype=np.float64) * (0.5 * _DEG2RAD))
 
     if distance is None:
         distance = np.max(np.abs(points_c[:, :2]) /
@@ -357,6 +397,29 @@ def look_at(points, fov, rotation=None, distance=None, center=None, pad=None):
     return cam_pose
 
 
+def _tan_half_fov(camera):
+    """
+    Get the tangent of half the field of view of a camera,
+    which is stored on the camera until the fov changes.
+
+    Parameters
+    --------------
+    camera : trimesh.scene.Camera
+      Camera object to get the value for
+
+    Returns
+    --------------
+    tan_half_fov : (2,) float
+      Tangent of half of the XY field of view
+    """
+    if camera._tan_half_fov is None:
+        # scale degrees to half-angle radians in one multiply
+        tan_half_fov = np.tan(camera.fov * (0.5 * _DEG2RAD))
+        tan_half_fov.flags.writeable = False
+        camera._tan_half_fov = tan_half_fov
+    return camera._tan_half_fov
+
+
 def ray_pixel_coords(camera):
     """
     Get the x-y coordinates of rays in camera coordinates at
@@ -385,14 +448,17 @@ def ray_pixel_coords(camera):
     xy : (n, 2) float
       x-y coordinates of intersection of each camera ray
       with the z == -1 frame
+    pixels : (n, 2) int
+      Pixel index for each coordinate
     """
+    # return the stored values if nothing has changed
+    if camera._pixel_coords is not None:
+        return camera._pixel_coords
+
     # shorthand
     res = camera.resolution
-    half_fov = np.radians(camera.fov) / 2.0
-
-    right_top = np.tan(half_fov)
     # move half a pixel width in
-    right_top *= 1 - (1.0 / res)
+    right_top = _tan_half_fov(camera) * (1 - (1.0 / res))
     left_bottom = -right_top
     # we are looking down the negative z axis, so
     # right_top corresponds to maximum x/y values
@@ -401,37 +467,65 @@ def ray_pixel_coords(camera):
     left, bottom = left_bottom
 
     # create a grid of vectors
-    xy = util.grid_linspace(
-        bounds=[[left, top], [right, bottom]],
-        count=camera.resolution)
+    xx, yy = np.meshgrid(np.linspace(left, right, res[0]),
+                         np.linspace(top, bottom, res[1]),
+                         indexing='ij')
+    xy = np.column_stack((xx.ravel(), yy.ravel()))
 
     # create a matching array of pixel indexes for the rays
-    pixels = util.grid_linspace(
-        bounds=[[0, res[1] - 1], [res[0] - 1, 0]],
-        count=res).astype(np.int64)
+    px, py = np.meshgrid(np.arange(res[0], dtype=np.int64),
+                         np.arange(res[1] - 1, -1, -1, dtype=np.int64),
+                         indexing='ij')
+    pixels = np.column_stack((px.ravel(), py.ravel()))
     assert xy.shape == pixels.shape
 
+    # stored values are shared so don't allow mutation
+    xy.flags.writeable = False
+    pixels.flags.writeable = False
+    camera._pixel_coords = (xy, pixels)
+
     return xy, pixels
 
 
-def camera_to_rays(camera):
+def camera_to_rays(camera, dtype=np.float32):
     """
     Calculate the trimesh.scene.Camera object to direction vectors.
 
     Will return one ray per pixel, as set in camera.resolution.
+    The returned arrays are cached on the camera and are
+    read-only, so copy them before modifying in place.
 
     Parameters
     --------------
     camera : trimesh.scene.Camera
+    dtype : numpy.dtype
+      Floating point type for the direction vectors, which
+      defaults to single precision as directions don't need more
 
     Returns
     --------------
     vectors : (n, 3) float
       Ray direction vectors in camera frame with z == -1
+    pixels : (n, 2) int
+      Which pixel each ray corresponds to in an image
     """
+    dtype = np.dtype(dtype)
+    # return the stored vectors if nothing has changed
+    if dtype in camera._rays:
+        return camera._rays[dtype]
+
     # get the on-plane coordinates
     xy, pixels = ray_pixel_coords(camera)
-    # convert vectors to 3D unit vectors
-    vectors = util.unitize(
-        np.column_stack((xy, -np.ones_like(xy[:, :1]))))
+    # stack into 3D vectors at z == -1 in the requested type
+    vectors = np.empty((len(xy), 3), dtype=dtype)
+    vectors[:, :2] = xy
+    vectors[:, 2] = -1.0
+    # convert to unit vectors, which never have zero
+    # length as every vector has a z component
+    vectors /= np.linalg.norm(vectors, axis=1).reshape((-1, 1))
+
+    # stored values are shared so don't allow mutation
+    vectors.flags.writeable = False
+    camera._rays[dtype] = (vectors, pixels)
+
     return vectors, pixels
@@ -622,33 +622,38 @@ class Scene(Geometry3D):
         """
         self.graph[self.camera.name] = matrix
 
-    def camera_rays(self):
+    def camera_rays(self, dtype=np.float32):
         """
         Calculate the trimesh.scene.Camera origin and ray
         direction vectors. Returns one ray per pixel as set
         in camera.resolution
 
+        Parameters
+        --------------
+        dtype : numpy.dtype
+          Floating point type of the ray direction vectors
+
         Returns
         --------------
-        origin: (n, 3) float
-          Ray origins in space
-        vectors: (n, 3) float
+        origin: (n, 3) float64
+          Ray origins in space, which are always float64
+          regardless of the dtype of the vectors
+        vectors: (n, 3) dtype
           Ray direction unit vectors in world coordinates
         pixels : (n, 2) int
-          Which pixel does each ray correspond to in an image
+          Which pixel does each ray correspond to in an image,
+          which is cached on the camera and read-only
         """
         # get the unit vectors of the camera
-        vectors, pixels = self.camera.to_rays()
+        vectors, pixels = self.camera.to_rays(dtype=dtype)
         # find our scene's transform for the camera
         transform = self.camera_transform
         # apply the rotation to the unit ray direction vectors
-        vectors = transformations.transform_points(
-            vectors,
-            transform,
-            translate=False)
+        # as a single matrix multiply rather than padding them
+        vectors = np.dot(vectors,
+                         transform[:3, :3].T.astype(vectors.dtype))
         # camera origin is single point so extract from
-        origins = (np.ones_like(vectors) *
-                   transformations.translation_from_matrix(transform))
+        origins = np.tile(transform[:3, 3], (len(vectors), 1))
         return origins, vectors, pixels
 
     @property